@@ -104,13 +104,13 @@ def example_function():
 # @Import Statements
 # Imports should usually be on separate lines.
 # The following code
-import os
-import sys
+    # import os
+    # import sys
 # is preferable to
-import sys, os
+    # import sys, os
 # However, it is okay to use commas when importing multiple items from a single module.
 # The following is acceptable:
-from subprocess import Popen, PIPE
+    # from subprocess import Popen, PIPE
 # The from keyword should be limited to imports that are used heavily within the current module, and which are guaranteed to not collide with any existing functions or variables.
 
 # @Naming Conventions
@@ -247,12 +247,12 @@ def draw_oval(x_coordinate, y_coordinate, width, height):
   
   # Ensure that x >= y
 #  here x and y are two Empty variables
-x =None
-y = None
-if (x < y):
-    tmp = x
-    x = y
-    y = tmp
+# x = None
+# y = None
+# if (x < y):
+#     tmp = x
+#     x = y
+#     y = tmp
     
 """ Note that a statement comment should explain what the group of statements does, not how it does it.
      """
@@ -279,13 +279,13 @@ if (x < y):
             # Sometimes people will add a comment to indicate the end of a code unit, like this
    # Ensure that x >= y
    #  here x and y are two Empty variables
-x =None
-y = None
-if (x < y):
-    tmp = x
-    x = y
-    y = tmp
-    # End of ensure x >= y
+# x = None
+# y = None
+# if (x < y):
+#     tmp = x
+#     x = y
+#     y = tmp
+#     # End of ensure x >= y
     
             # However, as long as you are consistent about the use of statement comments, this can always be inferred from the next statement comment or the end of the function or method.
             